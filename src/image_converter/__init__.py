@@ -1,4 +1 @@
 """Image Converter - Convert PNG/JPEG images to AVIF format."""
-
-__version__ = "1.0.0"
-
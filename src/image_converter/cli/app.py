@@ -1,15 +1,48 @@
 """Command-line interface for the image converter."""
 
 import argparse
+import itertools
 import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional
 
-from .. import __version__
-from ..core.converter import ImageConverter
 from ..core.formats import SUPPORTED_INPUT_FORMATS
-from ..utils.batch import BatchProcessor
-from ..utils.logger import setup_logger
+
+# Keep in sync with the version in pyproject.toml
+VERSION = "1.0.0"
+
+# Static help printed for bare/--help invocations without building the parser.
+# Keep in sync with create_parser().
+HELP_TEXT = """\
+usage: image-converter [options] input [input ...]
+
+Convert PNG and JPEG images to AVIF format.
+
+positional arguments:
+  input                 Input image file(s) or directory/directories.
+
+options:
+  -h, --help            Show this help message and exit.
+  -V, --version         Show program's version number and exit.
+  -o DIR, --output DIR  Output directory. Default: same as input.
+  --overwrite           Overwrite existing output files.
+  --skip-up-to-date     Skip files whose output is newer than the input.
+  -q N, --quality N     AVIF quality (0-100). Default: 80.
+  --[no-]strip-opaque-alpha
+                        Drop fully opaque alpha channels. Default: on.
+  -p N, --parallel N    Number of parallel workers. Default: 4.
+  --no-recursive        Don't search directories recursively.
+  --sorted              Collect and sort all files before converting.
+  -v, --verbose         Enable verbose (debug) output.
+  --log-file FILE       Write logs to file.
+  --quiet               Suppress progress output (only show summary).
+
+Examples:
+  image-converter photo.png                    # Convert single file
+  image-converter photos/                      # Convert all images in folder
+  image-converter *.jpg -o converted/ -q 90   # Batch convert with options
+  image-converter images/ -p 8 --overwrite    # Parallel conversion
+"""
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -35,7 +68,7 @@ def create_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "-V", "--version",
         action="version",
-        version=f"%(prog)s {__version__}",
+        version=f"%(prog)s {VERSION}",
     )
     
     # Input paths (positional, required)
@@ -60,6 +93,11 @@ def create_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Overwrite existing output files.",
     )
+    output_group.add_argument(
+        "--skip-up-to-date",
+        action="store_true",
+        help="Skip files whose output is newer than the input.",
+    )
     
     # Quality options
     quality_group = parser.add_argument_group("Quality Options")
@@ -70,6 +108,12 @@ def create_parser() -> argparse.ArgumentParser:
         metavar="N",
         help="AVIF quality (0-100). Higher = better quality, larger file. Default: 80.",
     )
+    quality_group.add_argument(
+        "--strip-opaque-alpha",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Drop fully opaque alpha channels before encoding. Default: on.",
+    )
     
     # Processing options
     proc_group = parser.add_argument_group("Processing Options")
@@ -85,6 +129,11 @@ def create_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Don't search directories recursively.",
     )
+    proc_group.add_argument(
+        "--sorted",
+        action="store_true",
+        help="Collect and sort all files before converting (default: stream as found).",
+    )
     
     # Logging options
     log_group = parser.add_argument_group("Logging Options")
@@ -110,6 +159,21 @@ def create_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def non_empty(files: Iterator[Path]) -> Optional[Iterator[Path]]:
+    """Check whether a file stream yields anything, without consuming it.
+    
+    Args:
+        files: Iterator of file paths.
+        
+    Returns:
+        An iterator over the same files, or None if there are none.
+    """
+    first = next(files, None)
+    if first is None:
+        return None
+    return itertools.chain([first], files)
+
+
 def print_summary(result, logger) -> None:
     """Print a summary of the batch conversion results.
     
@@ -123,6 +187,7 @@ def print_summary(result, logger) -> None:
     logger.info("=" * 50)
     logger.info(f"  Total files:    {result.total}")
     logger.info(f"  Successful:     {result.successful}")
+    logger.info(f"  Skipped:        {result.skipped}")
     logger.info(f"  Failed:         {result.failed}")
     logger.info(f"  Success rate:   {result.success_rate:.1f}%")
     logger.info("=" * 50)
@@ -131,9 +196,8 @@ def print_summary(result, logger) -> None:
     if result.failed > 0:
         logger.info("")
         logger.warning("Failed conversions:")
-        for conv_result in result.results:
-            if not conv_result.success:
-                logger.warning(f"  - {conv_result.filename}: {conv_result.error_message}")
+        for conv_result in result.failures:
+            logger.warning(f"  - {conv_result.filename}: {conv_result.error_message}")
 
 
 def main(argv: Optional[List[str]] = None) -> int:
@@ -145,19 +209,31 @@ def main(argv: Optional[List[str]] = None) -> int:
     Returns:
         Exit code (0 for success, 1 for failure).
     """
-    parser = create_parser()
-    
-    # Handle the conflict between -q for quality and -q for quiet
-    # by checking raw args first
     if argv is None:
         argv = sys.argv[1:]
     
+    # Fast paths that don't need the full parser
+    if argv in ([], ["-h"], ["--help"]):
+        print(HELP_TEXT, end="")
+        return 0
+    if argv in (["-V"], ["--version"]):
+        print(f"image-converter {VERSION}")
+        return 0
+    
+    parser = create_parser()
+    
     # Parse arguments
     try:
         args = parser.parse_args(argv)
     except SystemExit as e:
         return e.code if e.code is not None else 1
     
+    # Deferred so --help/--version and argument errors skip these imports
+    # (importing image_converter.utils also pulls in the batch machinery)
+    from ..core.converter import ImageConverter
+    from ..utils.batch import BatchProcessor
+    from ..utils.logger import setup_logger
+    
     # Setup logging
     logger = setup_logger(
         verbose=args.verbose,
@@ -165,25 +241,40 @@ def main(argv: Optional[List[str]] = None) -> int:
     )
     
     # Log startup info
-    logger.info(f"Image Converter v{__version__}")
+    logger.info(f"Image Converter v{VERSION}")
     logger.info(f"Quality: {args.quality} | Workers: {args.parallel}")
     
     # Create converter and processor
-    converter = ImageConverter(quality=args.quality)
+    converter = ImageConverter(
+        quality=args.quality,
+        strip_opaque_alpha=args.strip_opaque_alpha,
+    )
     processor = BatchProcessor(converter, max_workers=args.parallel)
     
-    # Collect and process files
-    files = processor.collect_files(
-        args.input,
-        recursive=not args.no_recursive,
-    )
+    # Collect files. By default they are streamed into the processor so
+    # conversion starts while directories are still being walked.
+    files: Optional[Iterable[Path]]
+    if args.sorted:
+        sorted_files = processor.collect_files(
+            args.input,
+            recursive=not args.no_recursive,
+        )
+        if sorted_files:
+            logger.info(f"Found {len(sorted_files)} image(s) to convert")
+        files = sorted_files or None
+    else:
+        files = non_empty(
+            processor.iter_files(
+                args.input,
+                recursive=not args.no_recursive,
+            )
+        )
     
-    if not files:
+    if files is None:
         logger.error("No supported image files found.")
         logger.info(f"Supported formats: {', '.join(sorted(SUPPORTED_INPUT_FORMATS))}")
         return 1
     
-    logger.info(f"Found {len(files)} image(s) to convert")
     logger.info("")
     
     # Process files
@@ -192,13 +283,14 @@ def main(argv: Optional[List[str]] = None) -> int:
         output_dir=args.output,
         overwrite=args.overwrite,
         show_progress=not getattr(args, 'quiet', False),
+        skip_up_to_date=args.skip_up_to_date,
     )
     
     # Print summary
     print_summary(result, logger)
     
     # Return appropriate exit code
-    if result.failed > 0 and result.successful == 0:
+    if result.failed > 0 and result.successful + result.skipped == 0:
         return 1  # Complete failure
     elif result.failed > 0:
         return 2  # Partial failure
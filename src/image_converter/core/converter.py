@@ -1,18 +1,40 @@
 """Core image conversion logic."""
 
+import io
 import logging
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
-
-# Import pillow-avif-plugin to register AVIF support
-import pillow_avif  # noqa: F401
-from PIL import Image
+from types import ModuleType
+from typing import Any, Iterable, Iterator, Optional, Tuple
 
 from .formats import is_supported_format, get_output_path
 
 logger = logging.getLogger(__name__)
 
+# PIL.Image module, imported on first conversion (see _lazy_pil)
+_PIL: Optional[ModuleType] = None
+
+
+def _lazy_pil() -> ModuleType:
+    """Import Pillow and register AVIF support on first use.
+    
+    Pillow and pillow-avif-plugin are slow to import, so they are deferred
+    until an image is actually converted rather than paid on every CLI start.
+    
+    Returns:
+        The PIL.Image module.
+    """
+    global _PIL
+    if _PIL is None:
+        # Import pillow-avif-plugin to register AVIF support
+        import pillow_avif  # noqa: F401
+        from PIL import Image
+        
+        _PIL = Image
+    return _PIL
+
 
 @dataclass
 class ConversionResult:
@@ -22,6 +44,7 @@ class ConversionResult:
     output_path: Optional[Path]
     success: bool
     error_message: Optional[str] = None
+    skipped: bool = False
     
     @property
     def filename(self) -> str:
@@ -39,13 +62,24 @@ class ImageConverter:
     MIN_QUALITY: int = 0
     MAX_QUALITY: int = 100
     
-    def __init__(self, quality: int = DEFAULT_QUALITY):
+    # Inputs smaller than this are read into memory in one call before
+    # decoding; larger files are streamed by Pillow
+    SMALL_FILE_BYTES: int = 4 * 1024 * 1024
+    
+    def __init__(
+        self,
+        quality: int = DEFAULT_QUALITY,
+        strip_opaque_alpha: bool = True,
+    ):
         """Initialize the converter.
         
         Args:
             quality: AVIF compression quality (0-100). Default is 80.
+            strip_opaque_alpha: Drop the alpha channel of RGBA images whose
+                alpha is fully opaque, so no alpha plane is encoded.
         """
         self.quality = self._validate_quality(quality)
+        self.strip_opaque_alpha = strip_opaque_alpha
     
     def _validate_quality(self, quality: int) -> int:
         """Validate and clamp quality to valid range.
@@ -73,6 +107,8 @@ class ImageConverter:
         input_path: Path,
         output_dir: Optional[Path] = None,
         overwrite: bool = False,
+        assume_exists: bool = False,
+        skip_up_to_date: bool = False,
     ) -> ConversionResult:
         """Convert a single image to AVIF format.
         
@@ -80,22 +116,125 @@ class ImageConverter:
             input_path: Path to the input image (PNG or JPEG).
             output_dir: Optional output directory. If None, saves alongside input.
             overwrite: Whether to overwrite existing output files.
+            assume_exists: Skip the up-front existence check, e.g. for files
+                that were just found by a directory walk. A missing file is
+                still reported when it is opened.
+            skip_up_to_date: Skip files whose output is at least as new as
+                the input, without decoding them.
             
         Returns:
             ConversionResult with success status and any error details.
         """
         input_path = Path(input_path)
+        output_path = get_output_path(input_path, output_dir)
         
-        # Validate input file exists
-        if not input_path.exists():
-            return ConversionResult(
-                input_path=input_path,
-                output_path=None,
-                success=False,
-                error_message=f"File not found: {input_path}",
+        try:
+            early = self._check(
+                input_path, output_path, overwrite, assume_exists, skip_up_to_date
             )
+            if early is not None:
+                return early
+            
+            # Ensure output directory exists
+            if output_dir is not None:
+                output_dir.mkdir(parents=True, exist_ok=True)
+            
+            # Perform the conversion
+            self._convert_image(input_path, output_path)
+        except Exception as e:
+            return self._failure(input_path, output_path, e)
+        return ConversionResult(
+            input_path=input_path,
+            output_path=output_path,
+            success=True,
+        )
+    
+    def convert_many(
+        self,
+        input_paths: Iterable[Path],
+        output_dir: Optional[Path] = None,
+        overwrite: bool = False,
+        assume_exists: bool = False,
+        skip_up_to_date: bool = False,
+    ) -> Iterator[ConversionResult]:
+        """Convert several images, decoding each one while the previous encodes.
+        
+        Decoding runs in a helper thread one file ahead of encoding. Pillow's
+        decoders and the AVIF encoder release the GIL, so the two stages
+        overlap without copying pixel data between processes.
+        
+        Args:
+            input_paths: Paths to the input images (PNG or JPEG).
+            output_dir: Optional output directory. If None, saves alongside input.
+            overwrite: Whether to overwrite existing output files.
+            assume_exists: Skip the up-front existence checks (see convert).
+            skip_up_to_date: Skip files whose output is at least as new as
+                the input, without decoding them.
+            
+        Yields:
+            One ConversionResult per input, in completion order.
+        """
+        with ThreadPoolExecutor(max_workers=1) as decoder:
+            # (input_path, output_path, decode future) awaiting encoding
+            ready: Optional[Tuple[Path, Path, Future]] = None
+            
+            for input_path in input_paths:
+                input_path = Path(input_path)
+                output_path = get_output_path(input_path, output_dir)
+                
+                # Inputs sharing an output (e.g. a.png and a.jpg) must see the
+                # earlier one written before the output checks run, as they
+                # would when converting one file at a time
+                if ready is not None and ready[1] == output_path:
+                    yield self._finish(*ready)
+                    ready = None
+                
+                try:
+                    early = self._check(
+                        input_path, output_path, overwrite, assume_exists, skip_up_to_date
+                    )
+                    
+                    # Ensure output directory exists
+                    if early is None and output_dir is not None:
+                        output_dir.mkdir(parents=True, exist_ok=True)
+                except Exception as e:
+                    early = self._failure(input_path, output_path, e)
+                
+                if early is not None:
+                    yield early
+                    continue
+                
+                # Start decoding this file, then encode the one before it
+                decoding = decoder.submit(self._decode, input_path)
+                queued = (input_path, output_path, decoding)
+                if ready is not None:
+                    yield self._finish(*ready)
+                ready = queued
+            
+            if ready is not None:
+                yield self._finish(*ready)
+    
+    def _check(
+        self,
+        input_path: Path,
+        output_path: Path,
+        overwrite: bool,
+        assume_exists: bool,
+        skip_up_to_date: bool,
+    ) -> Optional[ConversionResult]:
+        """Run the pre-conversion checks for one file.
         
-        # Validate input format
+        Args:
+            input_path: Path to the input image.
+            output_path: Path for the output AVIF file.
+            overwrite: Whether to overwrite existing output files.
+            assume_exists: Skip the input existence check.
+            skip_up_to_date: Skip files whose output is up to date.
+            
+        Returns:
+            A ConversionResult if the file should not be converted, else None.
+        """
+        # Validate input format (no filesystem access)
         if not is_supported_format(input_path):
             return ConversionResult(
                 input_path=input_path,
@@ -104,38 +243,129 @@ class ImageConverter:
                 error_message=f"Unsupported format: {input_path.suffix}",
             )
         
-        # Determine output path
-        output_path = get_output_path(input_path, output_dir)
+        # Existing outputs are checked before the input, so re-runs that have
+        # nothing to do cost a single stat per file. Like Path.exists(), a
+        # path through a non-directory counts as missing.
+        input_checked = assume_exists
+        if skip_up_to_date or not overwrite:
+            try:
+                output_mtime: Optional[float] = os.stat(output_path).st_mtime
+            except (FileNotFoundError, NotADirectoryError):
+                output_mtime = None
+            
+            if output_mtime is not None:
+                # Skip outputs that are newer than their input
+                if skip_up_to_date:
+                    try:
+                        input_mtime = os.stat(input_path).st_mtime
+                    except (FileNotFoundError, NotADirectoryError):
+                        return self._not_found(input_path)
+                    input_checked = True
+                    if output_mtime >= input_mtime:
+                        return ConversionResult(
+                            input_path=input_path,
+                            output_path=output_path,
+                            success=True,
+                            skipped=True,
+                        )
+                
+                # Check if output exists and we shouldn't overwrite
+                if not overwrite:
+                    return ConversionResult(
+                        input_path=input_path,
+                        output_path=output_path,
+                        success=False,
+                        error_message=f"Output exists (use --overwrite): {output_path}",
+                    )
         
-        # Check if output exists and we shouldn't overwrite
-        if output_path.exists() and not overwrite:
-            return ConversionResult(
-                input_path=input_path,
-                output_path=output_path,
-                success=False,
-                error_message=f"Output exists (use --overwrite): {output_path}",
-            )
+        # Validate input file exists
+        if not input_checked and not input_path.exists():
+            return self._not_found(input_path)
         
-        # Ensure output directory exists
-        if output_dir is not None:
-            output_dir.mkdir(parents=True, exist_ok=True)
+        return None
+    
+    def _finish(
+        self,
+        input_path: Path,
+        output_path: Path,
+        decoded: Future,
+    ) -> ConversionResult:
+        """Encode a file whose decode was started by convert_many.
         
-        # Perform the conversion
+        Args:
+            input_path: Path to the input image.
+            output_path: Path for the output AVIF file.
+            decoded: Future resolving to the result of _decode.
+            
+        Returns:
+            ConversionResult with success status and any error details.
+        """
         try:
-            self._convert_image(input_path, output_path)
-            return ConversionResult(
-                input_path=input_path,
-                output_path=output_path,
-                success=True,
-            )
+            self._encode(*decoded.result(), input_path, output_path)
         except Exception as e:
-            logger.exception(f"Failed to convert {input_path}")
-            return ConversionResult(
-                input_path=input_path,
-                output_path=output_path,
-                success=False,
-                error_message=str(e),
-            )
+            return self._failure(input_path, output_path, e)
+        return ConversionResult(
+            input_path=input_path,
+            output_path=output_path,
+            success=True,
+        )
+    
+    def _failure(
+        self,
+        input_path: Path,
+        output_path: Path,
+        error: Exception,
+    ) -> ConversionResult:
+        """Build the result for a conversion that raised.
+        
+        Args:
+            input_path: Path to the input image.
+            output_path: Path for the output AVIF file.
+            error: The exception raised while converting.
+            
+        Returns:
+            Failed ConversionResult.
+        """
+        # Input vanished (only reachable with assume_exists)
+        if isinstance(error, FileNotFoundError) and error.filename == str(input_path):
+            return self._not_found(input_path)
+        
+        logger.error(f"Failed to convert {input_path}", exc_info=error)
+        return ConversionResult(
+            input_path=input_path,
+            output_path=output_path,
+            success=False,
+            error_message=str(error),
+        )
+    
+    @staticmethod
+    def _not_found(input_path: Path) -> ConversionResult:
+        """Build the result for a missing input file.
+        
+        Args:
+            input_path: The missing input path.
+            
+        Returns:
+            Failed ConversionResult.
+        """
+        return ConversionResult(
+            input_path=input_path,
+            output_path=None,
+            success=False,
+            error_message=f"File not found: {input_path}",
+        )
+    
+    @staticmethod
+    def _has_opaque_alpha(img) -> bool:
+        """Check whether every pixel of an RGBA image is fully opaque.
+        
+        Args:
+            img: PIL image in RGBA mode.
+            
+        Returns:
+            True if the alpha channel is 255 everywhere.
+        """
+        return img.getchannel("A").getextrema() == (255, 255)
     
     def _convert_image(self, input_path: Path, output_path: Path) -> None:
         """Perform the actual image conversion.
@@ -147,41 +377,106 @@ class ImageConverter:
         Raises:
             Exception: If conversion fails.
         """
-        with Image.open(input_path) as img:
-            # Preserve ICC profile if present
-            icc_profile = img.info.get("icc_profile")
-            
-            # Handle transparency for PNG images
-            # AVIF supports transparency, so we preserve RGBA mode
-            if img.mode == "RGBA":
-                # Keep RGBA for transparency support
-                output_img = img
-            elif img.mode == "P" and "transparency" in img.info:
-                # Palette mode with transparency -> convert to RGBA
-                output_img = img.convert("RGBA")
-            elif img.mode in ("L", "LA"):
-                # Grayscale images
-                if img.mode == "LA":
-                    output_img = img.convert("RGBA")
-                else:
-                    output_img = img.convert("RGB")
-            else:
-                # Convert to RGB for JPEG and other formats
-                output_img = img.convert("RGB") if img.mode != "RGB" else img
+        self._encode(*self._decode(input_path), input_path, output_path)
+    
+    def _decode(self, input_path: Path) -> Tuple[Any, Optional[bytes]]:
+        """Decode an image and convert it to a mode suitable for AVIF.
+        
+        Args:
+            input_path: Path to input image.
             
-            # Save as AVIF with quality setting
-            save_kwargs = {
-                "quality": self.quality,
-            }
+        Returns:
+            Tuple of the loaded PIL image and its ICC profile, if any.
             
-            # Preserve ICC profile if available
-            if icc_profile:
-                save_kwargs["icc_profile"] = icc_profile
+        Raises:
+            Exception: If decoding fails.
+        """
+        Image = _lazy_pil()
+        
+        # One open serves both the size check and the read
+        with open(input_path, "rb") as fp:
+            if os.fstat(fp.fileno()).st_size < self.SMALL_FILE_BYTES:
+                # Small files are read in one call and decoded from memory
+                source: Any = io.BytesIO(fp.read())
+            else:
+                # Larger files are streamed by Pillow from the open file
+                source = fp
             
-            output_img.save(output_path, "AVIF", **save_kwargs)
+            try:
+                opened = Image.open(source)
+            except Image.UnidentifiedImageError as e:
+                # Name the file rather than the buffer or file object,
+                # matching the error Pillow raises when opening by path
+                raise Image.UnidentifiedImageError(
+                    f"cannot identify image file {str(input_path)!r}"
+                ) from e
             
-            logger.debug(
-                f"Converted {input_path.name} -> {output_path.name} "
-                f"(quality={self.quality})"
-            )
-
+            with opened as img:
+                # Preserve ICC profile if present
+                icc_profile = img.info.get("icc_profile")
+                
+                # Handle transparency for PNG images
+                # AVIF supports transparency, so we preserve RGBA mode
+                if img.mode == "RGBA":
+                    # Keep RGBA for transparency support
+                    output_img = img
+                elif img.mode == "P" and "transparency" in img.info:
+                    # Palette mode with transparency -> convert to RGBA
+                    output_img = img.convert("RGBA")
+                elif img.mode in ("L", "LA"):
+                    # Grayscale images
+                    if img.mode == "LA":
+                        output_img = img.convert("RGBA")
+                    else:
+                        output_img = img.convert("RGB")
+                else:
+                    # Convert to RGB for JPEG and other formats
+                    output_img = img.convert("RGB") if img.mode != "RGB" else img
+                
+                # An all-opaque alpha plane carries no information; dropping it
+                # lets the encoder skip alpha entirely
+                if (
+                    self.strip_opaque_alpha
+                    and output_img.mode == "RGBA"
+                    and self._has_opaque_alpha(output_img)
+                ):
+                    output_img = output_img.convert("RGB")
+                
+                # Decode now, while the source file is still open
+                output_img.load()
+        
+        return output_img, icc_profile
+    
+    def _encode(
+        self,
+        img: Any,
+        icc_profile: Optional[bytes],
+        input_path: Path,
+        output_path: Path,
+    ) -> None:
+        """Encode a decoded image to AVIF.
+        
+        Args:
+            img: PIL image returned by _decode.
+            icc_profile: ICC profile to embed, if any.
+            input_path: Path to input image (for logging).
+            output_path: Path for output AVIF file.
+            
+        Raises:
+            Exception: If encoding fails.
+        """
+        # Save as AVIF with quality setting
+        save_kwargs = {
+            "quality": self.quality,
+        }
+        
+        # Preserve ICC profile if available
+        if icc_profile:
+            save_kwargs["icc_profile"] = icc_profile
+        
+        img.save(output_path, "AVIF", **save_kwargs)
+        
+        logger.debug(
+            f"Converted {input_path.name} -> {output_path.name} "
+            f"(quality={self.quality})"
+        )
@@ -1,25 +1,41 @@
 """Supported image formats and validation utilities."""
 
+import os
 from pathlib import Path
-from typing import Set
+from typing import FrozenSet, Tuple
 
 # Supported input formats (lowercase extensions)
-SUPPORTED_INPUT_FORMATS: Set[str] = {".png", ".jpg", ".jpeg"}
+SUPPORTED_INPUT_FORMATS: FrozenSet[str] = frozenset({".png", ".jpg", ".jpeg"})
+
+# Lower- and uppercase endings, for a single str.endswith() check
+_SUPPORTED_ENDINGS: Tuple[str, ...] = tuple(
+    ext for e in SUPPORTED_INPUT_FORMATS for ext in (e, e.upper())
+)
+
+# Separators that can precede a file name in a path string
+_PATH_SEPARATORS: str = os.sep + (os.altsep or "")
 
 # Output format
 OUTPUT_FORMAT: str = ".avif"
 
 
-def is_supported_format(file_path: Path) -> bool:
+def is_supported_format(file_path: Path | str) -> bool:
     """Check if a file has a supported input format.
     
     Args:
-        file_path: Path to the image file.
+        file_path: Path or file name of the image file.
         
     Returns:
         True if the file extension is supported, False otherwise.
     """
-    return file_path.suffix.lower() in SUPPORTED_INPUT_FORMATS
+    name = str(file_path)
+    if name.endswith(_SUPPORTED_ENDINGS):
+        # As with Path.suffix, a name that is only the extension (".png")
+        # has no suffix
+        dot = name.rfind(".")
+        return dot > 0 and name[dot - 1] not in _PATH_SEPARATORS
+    # Mixed-case extensions such as ".Png" are rare; check them the slow way
+    return os.path.splitext(name)[1].lower() in SUPPORTED_INPUT_FORMATS
 
 
 def get_output_path(input_path: Path, output_dir: Path | None = None) -> Path:
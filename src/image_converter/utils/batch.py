@@ -1,17 +1,118 @@
 """Batch processing with parallel execution support."""
 
+import itertools
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import logging.handlers
+import multiprocessing
+import os
+import time
+from contextlib import contextmanager
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    BrokenExecutor,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterator, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Sized, Type
 
 from ..core.converter import ConversionResult, ImageConverter
-from ..core.formats import SUPPORTED_INPUT_FORMATS
+from ..core.formats import is_supported_format
 
 logger = logging.getLogger(__name__)
 
 
+def _iter_images(root: Path, recursive: bool) -> Iterator[Path]:
+    """Yield supported image files under a directory.
+    
+    Walks the tree once with os.scandir and filters by extension in-process,
+    instead of running a separate glob per extension.
+    
+    Args:
+        root: Directory to search.
+        recursive: Whether to descend into subdirectories.
+        
+    Yields:
+        Paths of supported image files.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        if is_supported_format(entry.name):
+                            yield Path(entry.path)
+                    elif recursive and entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except OSError as e:
+            logger.warning(f"Cannot read directory {directory}: {e}")
+
+
+def _init_worker(log_queue: Any, level: int) -> None:
+    """Forward a spawned worker's log records to the parent process.
+    
+    Spawned interpreters start without the parent's logging setup, so the
+    package logger is pointed at a queue drained by the parent.
+    
+    Args:
+        log_queue: multiprocessing queue read by the parent's QueueListener.
+        level: Effective level of the parent's package logger.
+    """
+    package_logger = logging.getLogger("image_converter")
+    package_logger.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    package_logger.setLevel(level)
+    package_logger.propagate = False
+
+
+class _ParentLogHandler(logging.Handler):
+    """Handler that re-emits worker records through the parent's loggers."""
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """Dispatch a forwarded record to the logger it was logged on.
+        
+        Args:
+            record: Log record received from a worker process.
+        """
+        logging.getLogger(record.name).handle(record)
+
+
+def _convert_chunk(
+    converter: ImageConverter,
+    files: List[Path],
+    output_dir: Optional[Path],
+    overwrite: bool,
+    skip_up_to_date: bool,
+) -> List[ConversionResult]:
+    """Convert a chunk of files in one worker task.
+    
+    Module-level so it can be pickled for ProcessPoolExecutor workers.
+    
+    Args:
+        converter: The ImageConverter instance to use.
+        files: Image files to convert.
+        output_dir: Optional output directory for all converted files.
+        overwrite: Whether to overwrite existing files.
+        skip_up_to_date: Whether to skip files whose output is up to date.
+        
+    Returns:
+        One ConversionResult per file.
+    """
+    return list(
+        converter.convert_many(
+            files,
+            output_dir,
+            overwrite,
+            assume_exists=True,
+            skip_up_to_date=skip_up_to_date,
+        )
+    )
+
+
 @dataclass
 class BatchResult:
     """Summary of a batch conversion operation."""
@@ -20,14 +121,64 @@ class BatchResult:
     successful: int = 0
     failed: int = 0
     skipped: int = 0
-    results: List[ConversionResult] = field(default_factory=list)
+    # Only failed conversions are kept; successes are just counted
+    failures: List[ConversionResult] = field(default_factory=list)
     
     @property
     def success_rate(self) -> float:
         """Calculate the success rate as a percentage."""
         if self.total == 0:
             return 0.0
-        return (self.successful / self.total) * 100
+        return ((self.successful + self.skipped) / self.total) * 100
+
+
+class _ProgressLog:
+    """Progress line logger that can buffer lines into batched log calls.
+    
+    Each log call walks the handlers and writes to the console, which adds
+    up over large batches. When batching, successful lines are flushed as a
+    single multi-line record every BATCH_SIZE lines or FLUSH_INTERVAL
+    seconds; warnings and errors flush the buffer and are logged at once.
+    """
+    
+    BATCH_SIZE: int = 64
+    FLUSH_INTERVAL: float = 0.25
+    
+    def __init__(self, batched: bool):
+        """Initialize the progress logger.
+        
+        Args:
+            batched: Whether to buffer INFO lines instead of logging each one.
+        """
+        self.batched = batched
+        self.lines: List[str] = []
+        self.last_flush = time.monotonic()
+    
+    def log(self, level: int, msg: str) -> None:
+        """Log or buffer a progress line.
+        
+        Args:
+            level: Logging level of the line.
+            msg: The progress message.
+        """
+        if not self.batched or level > logging.INFO:
+            self.flush()
+            logger.log(level, msg)
+            return
+        
+        self.lines.append(msg)
+        if (
+            len(self.lines) >= self.BATCH_SIZE
+            or time.monotonic() - self.last_flush > self.FLUSH_INTERVAL
+        ):
+            self.flush()
+    
+    def flush(self) -> None:
+        """Emit any buffered lines as one log record."""
+        if self.lines:
+            logger.info("\n".join(self.lines))
+            self.lines.clear()
+        self.last_flush = time.monotonic()
 
 
 class BatchProcessor:
@@ -35,140 +186,323 @@ class BatchProcessor:
     
     DEFAULT_WORKERS: int = 4
     
+    # Files per worker task. Sized inputs are split into about four chunks
+    # per worker, capped at MAX_CHUNK_SIZE. Streamed inputs of unknown
+    # length start with single-file tasks, so every worker gets work even
+    # for small batches, and double the chunk size after each round of
+    # max_workers tasks, up to STREAM_CHUNK_SIZE.
+    MAX_CHUNK_SIZE: int = 64
+    STREAM_CHUNK_SIZE: int = 8
+    
     def __init__(
         self,
         converter: ImageConverter,
         max_workers: int = DEFAULT_WORKERS,
+        executor_cls: Type[Executor] = ProcessPoolExecutor,
     ):
         """Initialize the batch processor.
         
         Args:
             converter: The ImageConverter instance to use.
             max_workers: Maximum number of parallel workers.
+            executor_cls: Executor class used to run conversions. Defaults to
+                ProcessPoolExecutor, since AVIF encoding is CPU-bound.
         """
         self.converter = converter
         self.max_workers = max(1, max_workers)
+        self.executor_cls = executor_cls
     
-    def collect_files(self, paths: List[Path], recursive: bool = True) -> List[Path]:
-        """Collect all supported image files from given paths.
+    @contextmanager
+    def _worker_log_queue(self) -> Iterator[Optional[Any]]:
+        """Collect log records from worker processes while the block runs.
+        
+        Yields:
+            Queue for _init_worker, or None when workers share this process.
+        """
+        if self.executor_cls is not ProcessPoolExecutor:
+            yield None
+            return
+        
+        log_queue = multiprocessing.get_context("spawn").Queue()
+        listener = logging.handlers.QueueListener(log_queue, _ParentLogHandler())
+        listener.start()
+        try:
+            yield log_queue
+        finally:
+            # Drains records still queued by the (already joined) workers
+            listener.stop()
+    
+    def _create_executor(self, log_queue: Optional[Any] = None) -> Executor:
+        """Create the executor used to run conversions in parallel.
+        
+        Args:
+            log_queue: Queue that process workers forward log records to.
+            
+        Returns:
+            Executor instance sized to max_workers.
+        """
+        if self.executor_cls is ProcessPoolExecutor:
+            level = logging.getLogger("image_converter").getEffectiveLevel()
+            return ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(log_queue, level),
+            )
+        
+        return self.executor_cls(max_workers=self.max_workers)
+    
+    def iter_files(self, paths: List[Path], recursive: bool = True) -> Iterator[Path]:
+        """Lazily yield all supported image files from given paths.
+        
+        Files are yielded in traversal order, as soon as they are found.
         
         Args:
             paths: List of file or directory paths.
             recursive: Whether to search directories recursively.
             
-        Returns:
-            List of valid image file paths.
+        Yields:
+            Valid image file paths, without duplicates.
         """
-        files: List[Path] = []
+        # A single file or a single directory walk cannot yield duplicates
+        dedup = len(paths) > 1
+        # Keys are normalized absolute path strings, accumulated as files are
+        # found. Unlike resolve() or a per-file abspath(), this needs no
+        # syscalls beyond a single getcwd().
+        cwd = os.getcwd() if dedup else ""
+        seen: Set[str] = set()
         
         for path in paths:
             path = Path(path)
             
             if path.is_file():
-                if path.suffix.lower() in SUPPORTED_INPUT_FORMATS:
-                    files.append(path)
+                if is_supported_format(path):
+                    found: Iterable[Path] = (path,)
                 else:
                     logger.warning(f"Skipping unsupported file: {path}")
+                    continue
             
             elif path.is_dir():
                 # Collect files from directory
-                pattern = "**/*" if recursive else "*"
-                for ext in SUPPORTED_INPUT_FORMATS:
-                    files.extend(path.glob(f"{pattern}{ext}"))
-                    # Also check uppercase extensions
-                    files.extend(path.glob(f"{pattern}{ext.upper()}"))
+                found = _iter_images(path, recursive)
             
             else:
                 logger.warning(f"Path not found: {path}")
+                continue
+            
+            for f in found:
+                if dedup:
+                    key = os.path.normcase(os.path.normpath(os.path.join(cwd, f)))
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                yield f
+    
+    def collect_files(self, paths: List[Path], recursive: bool = True) -> List[Path]:
+        """Collect all supported image files from given paths.
         
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_files = []
-        for f in files:
-            resolved = f.resolve()
-            if resolved not in seen:
-                seen.add(resolved)
-                unique_files.append(f)
-        
-        return sorted(unique_files)
+        Args:
+            paths: List of file or directory paths.
+            recursive: Whether to search directories recursively.
+            
+        Returns:
+            Sorted list of valid image file paths.
+        """
+        return sorted(self.iter_files(paths, recursive=recursive))
     
     def process(
         self,
-        files: List[Path],
+        files: Iterable[Path],
         output_dir: Optional[Path] = None,
         overwrite: bool = False,
         show_progress: bool = True,
+        skip_up_to_date: bool = False,
     ) -> BatchResult:
         """Process a batch of image files.
         
+        Files are drawn from ``files`` as conversions complete, so an
+        iterator such as iter_files() is consumed while earlier files are
+        still converting.
+        
         Args:
-            files: List of image files to convert.
+            files: Image files to convert (a list or any iterable).
             output_dir: Optional output directory for all converted files.
             overwrite: Whether to overwrite existing files.
             show_progress: Whether to print progress updates.
+            skip_up_to_date: Whether to skip files whose output is up to date.
             
         Returns:
-            BatchResult with statistics and individual results.
+            BatchResult with statistics and failed results.
         """
-        result = BatchResult(total=len(files))
+        result = BatchResult()
+        
+        # Progress shows "[i/N]" when the total is known up front
+        expected = len(files) if isinstance(files, Sized) else None
         
-        if not files:
+        if expected == 0:
             logger.warning("No files to process")
             return result
         
-        logger.info(f"Processing {len(files)} file(s) with {self.max_workers} worker(s)")
+        if expected is not None:
+            logger.info(f"Processing {expected} file(s) with {self.max_workers} worker(s)")
+        else:
+            logger.info(f"Processing files with {self.max_workers} worker(s)")
         
-        # Process files in parallel
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all conversion tasks
-            future_to_file = {
-                executor.submit(
-                    self.converter.convert,
-                    file_path,
-                    output_dir,
-                    overwrite,
-                ): file_path
-                for file_path in files
-            }
+        # With --verbose every file is logged as it completes; otherwise
+        # progress lines are batched
+        progress = _ProgressLog(batched=not logger.isEnabledFor(logging.DEBUG))
+        
+        # Collect results as they complete
+        for conv_result in self._run(files, output_dir, overwrite, skip_up_to_date):
+            result.total += 1
             
-            # Collect results as they complete
-            for i, future in enumerate(as_completed(future_to_file), 1):
-                file_path = future_to_file[future]
-                
-                try:
-                    conv_result = future.result()
-                    result.results.append(conv_result)
-                    
-                    if conv_result.success:
-                        result.successful += 1
-                        status = "✓"
-                        level = logging.INFO
-                    else:
-                        result.failed += 1
-                        status = "✗"
-                        level = logging.WARNING
-                    
-                    if show_progress:
-                        msg = f"[{i}/{len(files)}] {status} {conv_result.filename}"
-                        if conv_result.error_message:
-                            msg += f" - {conv_result.error_message}"
-                        logger.log(level, msg)
-                        
-                except Exception as e:
-                    result.failed += 1
-                    result.results.append(
-                        ConversionResult(
-                            input_path=file_path,
-                            output_path=None,
-                            success=False,
-                            error_message=str(e),
-                        )
-                    )
-                    if show_progress:
-                        logger.error(f"[{i}/{len(files)}] ✗ {file_path.name} - {e}")
+            if conv_result.skipped:
+                result.skipped += 1
+                status = "↷"
+                level = logging.INFO
+            elif conv_result.success:
+                result.successful += 1
+                status = "✓"
+                level = logging.INFO
+            else:
+                result.failed += 1
+                result.failures.append(conv_result)
+                status = "✗"
+                level = logging.WARNING
+            
+            if show_progress:
+                counter = (
+                    f"{result.total}/{expected}" if expected is not None else f"{result.total}"
+                )
+                msg = f"[{counter}] {status} {conv_result.filename}"
+                if conv_result.error_message:
+                    msg += f" - {conv_result.error_message}"
+                elif conv_result.skipped:
+                    msg += " - up to date"
+                progress.log(level, msg)
+        
+        progress.flush()
+        
+        if result.total == 0:
+            logger.warning("No files to process")
         
         return result
     
+    def _run(
+        self,
+        files: Iterable[Path],
+        output_dir: Optional[Path],
+        overwrite: bool,
+        skip_up_to_date: bool,
+    ) -> Iterator[ConversionResult]:
+        """Convert files and yield their results as they complete.
+        
+        A single worker converts in-process, decoding each file while the
+        previous one encodes (see ImageConverter.convert_many). Otherwise
+        files go to the executor in chunks, one task per chunk, with at most
+        ``2 * max_workers`` chunks in flight.
+        
+        Args:
+            files: Image files to convert.
+            output_dir: Optional output directory for all converted files.
+            overwrite: Whether to overwrite existing files.
+            skip_up_to_date: Whether to skip files whose output is up to date.
+            
+        Yields:
+            One ConversionResult per file.
+        """
+        if self.max_workers == 1:
+            # No executor: avoids spawning a child interpreter
+            yield from self.converter.convert_many(
+                files,
+                output_dir,
+                overwrite,
+                assume_exists=True,
+                skip_up_to_date=skip_up_to_date,
+            )
+            return
+        
+        if isinstance(files, Sized):
+            chunk_size = max(
+                1, min(self.MAX_CHUNK_SIZE, len(files) // (4 * self.max_workers))
+            )
+            ramp_up = False
+        else:
+            chunk_size = 1
+            ramp_up = True
+        submitted = 0
+        
+        window = 2 * self.max_workers
+        file_iter = iter(files)
+        exhausted = False
+        pending: Dict[Future, List[Path]] = {}
+        
+        # Process files in parallel
+        with (
+            self._worker_log_queue() as log_queue,
+            self._create_executor(log_queue) as executor,
+        ):
+            while True:
+                # Top up the in-flight window from the file iterator
+                while not exhausted and len(pending) < window:
+                    chunk = list(itertools.islice(file_iter, chunk_size))
+                    if not chunk:
+                        exhausted = True
+                        break
+                    try:
+                        future = executor.submit(
+                            _convert_chunk,
+                            self.converter,
+                            chunk,
+                            output_dir,
+                            overwrite,
+                            skip_up_to_date,
+                        )
+                    except BrokenExecutor as e:
+                        # The pool is unusable (e.g. a worker process died):
+                        # report the remaining files so the run still ends
+                        # with a summary
+                        exhausted = True
+                        for file_path in itertools.chain(chunk, file_iter):
+                            yield self._worker_failure(file_path, e)
+                        break
+                    pending[future] = chunk
+                    submitted += 1
+                    if ramp_up and submitted % self.max_workers == 0:
+                        chunk_size = min(self.STREAM_CHUNK_SIZE, 2 * chunk_size)
+                
+                if not pending:
+                    break
+                
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    chunk = pending.pop(future)
+                    try:
+                        yield from future.result()
+                    except Exception as e:
+                        # The worker itself failed (e.g. a crashed process)
+                        for file_path in chunk:
+                            yield self._worker_failure(file_path, e)
+    
+    @staticmethod
+    def _worker_failure(file_path: Path, error: Exception) -> ConversionResult:
+        """Build the result for a file whose worker task could not complete.
+        
+        Args:
+            file_path: The input file.
+            error: The exception raised by the executor.
+            
+        Returns:
+            Failed ConversionResult.
+        """
+        return ConversionResult(
+            input_path=file_path,
+            output_path=None,
+            success=False,
+            error_message=str(error),
+        )
+    
     def process_paths(
         self,
         paths: List[Path],
@@ -176,10 +510,11 @@ class BatchProcessor:
         overwrite: bool = False,
         recursive: bool = True,
         show_progress: bool = True,
+        skip_up_to_date: bool = False,
     ) -> BatchResult:
         """Collect files from paths and process them.
         
-        Convenience method that combines collect_files and process.
+        Convenience method that streams iter_files into process.
         
         Args:
             paths: List of file or directory paths.
@@ -187,15 +522,17 @@ class BatchProcessor:
             overwrite: Whether to overwrite existing files.
             recursive: Whether to search directories recursively.
             show_progress: Whether to print progress updates.
+            skip_up_to_date: Whether to skip files whose output is up to date.
             
         Returns:
-            BatchResult with statistics and individual results.
+            BatchResult with statistics and failed results.
         """
-        files = self.collect_files(paths, recursive=recursive)
+        files = self.iter_files(paths, recursive=recursive)
         return self.process(
             files,
             output_dir=output_dir,
             overwrite=overwrite,
             show_progress=show_progress,
+            skip_up_to_date=skip_up_to_date,
         )
 
@@ -4,6 +4,10 @@ import logging
 import sys
 from typing import Optional
 
+LOG_FORMAT = "%(asctime)s | %(levelname)-8s | %(message)s"
+COLORED_LOG_FORMAT = "%(asctime)s | %(colored_level)s | %(message)s"
+DATE_FORMAT = "%H:%M:%S"
+
 
 def setup_logger(
     verbose: bool = False,
@@ -26,15 +30,18 @@ def setup_logger(
     logger.handlers.clear()
     
     # Create formatter
-    formatter = logging.Formatter(
-        fmt="%(asctime)s | %(levelname)-8s | %(message)s",
-        datefmt="%H:%M:%S",
-    )
+    formatter = logging.Formatter(fmt=LOG_FORMAT, datefmt=DATE_FORMAT)
     
-    # Console handler with colors
+    # Console handler, with colored levels only when writing to a terminal
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.DEBUG if verbose else logging.INFO)
-    console_handler.setFormatter(ColoredFormatter(formatter))
+    if sys.stdout.isatty():
+        console_handler.addFilter(ColoredLevelFilter())
+        console_handler.setFormatter(
+            logging.Formatter(fmt=COLORED_LOG_FORMAT, datefmt=DATE_FORMAT)
+        )
+    else:
+        console_handler.setFormatter(formatter)
     logger.addHandler(console_handler)
     
     # File handler (optional)
@@ -47,8 +54,12 @@ def setup_logger(
     return logger
 
 
-class ColoredFormatter(logging.Formatter):
-    """Formatter that adds ANSI colors to log levels."""
+class ColoredLevelFilter(logging.Filter):
+    """Filter that attaches an ANSI-colored level name to each record.
+    
+    The colored, padded level strings are built once; records only get a
+    dict lookup, exposed to formatters as ``%(colored_level)s``.
+    """
     
     # ANSI color codes
     COLORS = {
@@ -60,35 +71,25 @@ class ColoredFormatter(logging.Formatter):
     }
     RESET = "\033[0m"
     
-    def __init__(self, base_formatter: logging.Formatter):
-        """Initialize with a base formatter.
-        
-        Args:
-            base_formatter: The formatter to wrap with colors.
-        """
+    def __init__(self):
+        """Precompute the colored level names."""
         super().__init__()
-        self.base_formatter = base_formatter
+        self.colored_levels = {
+            level: f"{color}{logging.getLevelName(level):<8}{self.RESET}"
+            for level, color in self.COLORS.items()
+        }
     
-    def format(self, record: logging.LogRecord) -> str:
-        """Format the log record with colors.
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Set ``record.colored_level``.
         
         Args:
-            record: The log record to format.
+            record: The log record being emitted.
             
         Returns:
-            Formatted string with ANSI colors.
+            Always True; records are never dropped.
         """
-        # Get the base formatted message
-        message = self.base_formatter.format(record)
-        
-        # Add color based on level
-        color = self.COLORS.get(record.levelno, "")
-        if color:
-            # Color just the level name portion
-            return message.replace(
-                record.levelname,
-                f"{color}{record.levelname}{self.RESET}",
-                1,
-            )
-        return message
-
+        colored = self.colored_levels.get(record.levelno)
+        if colored is None:
+            colored = f"{record.levelname:<8}"
+        record.colored_level = colored
+        return True